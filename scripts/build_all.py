@@ -0,0 +1,19 @@
+"""Regenerate every app asset in one process.
+
+Runs the icon, feature graphic and mipmap generators in order, sharing one
+warm PIL import and handing the rendered icon to the others in memory rather
+than re-reading assets/app-icon-512.png.
+"""
+import generate_feature_graphic
+import generate_icon
+import generate_mipmaps
+
+
+def main():
+    icon = generate_icon.main()
+    generate_feature_graphic.main(icon)
+    generate_mipmaps.main(icon)
+
+
+if __name__ == '__main__':
+    main()
@@ -1,68 +1,17 @@
 """Generate a 1024x500 feature graphic for Google Play Store."""
-from PIL import Image, ImageDraw, ImageFont
+from PIL import Image, ImageDraw, ImageFilter, ImageFont
+import numpy as np
+import json
 import os
 
 WIDTH = 1024
 HEIGHT = 500
 output_path = os.path.join(os.path.dirname(__file__), '..', 'assets', 'feature-graphic.png')
-
-img = Image.new('RGBA', (WIDTH, HEIGHT), (0, 0, 0, 0))
-draw = ImageDraw.Draw(img)
-
-# Green gradient background
-for y in range(HEIGHT):
-    progress = y / HEIGHT
-    r = int(85 - 30 * progress)
-    g = int(195 - 50 * progress)
-    b = int(90 - 30 * progress)
-    draw.line([(0, y), (WIDTH, y)], fill=(r, g, b))
-
-# Subtle radial glow in center-left area
-glow = Image.new('RGBA', (WIDTH, HEIGHT), (0, 0, 0, 0))
-glow_draw = ImageDraw.Draw(glow)
-cx_glow, cy_glow = WIDTH // 3, HEIGHT // 2
-for radius in range(300, 0, -1):
-    alpha = int(25 * (1 - radius / 300))
-    glow_draw.ellipse(
-        [(cx_glow - radius, cy_glow - radius), (cx_glow + radius, cy_glow + radius)],
-        fill=(255, 255, 255, alpha)
-    )
-img = Image.alpha_composite(img, glow)
-draw = ImageDraw.Draw(img)
-
-# Load app icon and place on the right side
 icon_path = os.path.join(os.path.dirname(__file__), '..', 'assets', 'app-icon-512.png')
-if os.path.exists(icon_path):
-    icon = Image.open(icon_path).convert('RGBA')
-    icon_size = 280
-    icon = icon.resize((icon_size, icon_size), Image.LANCZOS)
-
-    # Add subtle shadow behind icon
-    shadow = Image.new('RGBA', (WIDTH, HEIGHT), (0, 0, 0, 0))
-    shadow_draw = ImageDraw.Draw(shadow)
-    icon_x = WIDTH - icon_size - 100
-    icon_y = (HEIGHT - icon_size) // 2
-    shadow_draw.rounded_rectangle(
-        [(icon_x + 6, icon_y + 6), (icon_x + icon_size + 6, icon_y + icon_size + 6)],
-        radius=55,
-        fill=(0, 0, 0, 40)
-    )
-    img = Image.alpha_composite(img, shadow)
-    draw = ImageDraw.Draw(img)
-
-    img.paste(icon, (icon_x, icon_y), icon)
-
-# Text on the left side
-# Try to load a nice font, fall back to default
-text_x = 80
-white = (255, 255, 255)
-white_sub = (255, 255, 255, 220)
+# Font paths found by earlier runs, so repeat builds skip most of the probing
+font_cache_path = os.path.join(os.path.dirname(__file__), '.font-cache.json')
 
 # Try common Windows fonts
-font_title = None
-font_subtitle = None
-font_tagline = None
-
 font_paths = [
     "C:/Windows/Fonts/segoeui.ttf",
     "C:/Windows/Fonts/arial.ttf",
@@ -79,53 +28,142 @@ font_light_paths = [
     "C:/Windows/Fonts/arial.ttf",
 ]
 
-for fp in font_bold_paths:
-    if os.path.exists(fp):
-        font_title = ImageFont.truetype(fp, 62)
-        break
-
-for fp in font_paths:
-    if os.path.exists(fp):
-        font_subtitle = ImageFont.truetype(fp, 30)
-        break
-
-for fp in font_light_paths:
-    if os.path.exists(fp):
-        font_tagline = ImageFont.truetype(fp, 24)
-        break
-
-if not font_title:
-    font_title = ImageFont.load_default()
-if not font_subtitle:
-    font_subtitle = ImageFont.load_default()
-if not font_tagline:
-    font_tagline = ImageFont.load_default()
-
-# App name
-title_y = 130
-draw.text((text_x, title_y), "Family", fill=white, font=font_title)
-title_w = draw.textlength("Family", font=font_title)
-draw.text((text_x, title_y + 70), "Shopping List", fill=white, font=font_title)
-
-# Divider line
-line_y = title_y + 160
-draw.line([(text_x, line_y), (text_x + 80, line_y)], fill=(255, 255, 255, 180), width=3)
-
-# Tagline
-draw.text(
-    (text_x, line_y + 20),
-    "Shop together. Stay organized.",
-    fill=white_sub,
-    font=font_subtitle
-)
-
-# Sub-tagline
-draw.text(
-    (text_x, line_y + 60),
-    "Real-time sync  |  Budget tracking  |  Family groups",
-    fill=(255, 255, 255, 160),
-    font=font_tagline
-)
-
-img.save(output_path, 'PNG')
-print(f"Feature graphic saved to: {output_path}")
+
+def pick(paths):
+    """Return the first font path that exists, or None."""
+    return next((p for p in paths if os.path.exists(p)), None)
+
+
+def resolve_font_paths():
+    """Return the title, subtitle and tagline font paths, reusing cached hits."""
+    roles = {
+        'title_path': font_bold_paths,
+        'subtitle_path': font_paths,
+        'tagline_path': font_light_paths,
+    }
+    try:
+        with open(font_cache_path) as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        cache = {}
+
+    resolved = {}
+    for role, paths in roles.items():
+        cached = cache.get(role)
+        resolved[role] = cached if cached and os.path.exists(cached) else pick(paths)
+
+    if resolved != cache:
+        # Best effort: a read-only checkout just rescans next time
+        try:
+            with open(font_cache_path, 'w') as f:
+                json.dump(resolved, f, indent=2)
+        except OSError:
+            pass
+    return resolved['title_path'], resolved['subtitle_path'], resolved['tagline_path']
+
+
+def load_font(path, size):
+    """Load path at size, or Pillow's default font when no path was found."""
+    if path is None:
+        return ImageFont.load_default()
+    return ImageFont.truetype(path, size)
+
+
+def main(icon=None):
+    """Render and save the feature graphic.
+
+    icon is the app icon as a PIL image; when omitted it is read from icon_path.
+    """
+    # Green gradient background, built as one array instead of a line per row
+    progress = (np.arange(HEIGHT) / HEIGHT)[:, None]
+    rows = np.stack([85 - 30 * progress, 195 - 50 * progress, 90 - 30 * progress], axis=-1)
+    background = np.ascontiguousarray(np.broadcast_to(rows.astype(np.uint8), (HEIGHT, WIDTH, 3)))
+    img = Image.fromarray(background, 'RGB')
+
+    # Glow and icon shadow are gathered on one effects layer and blended onto
+    # the background in a single composite. The graphic itself never needs
+    # alpha, so it stays RGB and the layer is applied as a paste mask.
+
+    # Subtle radial glow in center-left area
+    # Alpha falls off linearly with distance from the glow centre
+    cx_glow, cy_glow = WIDTH // 3, HEIGHT // 2
+    yy, xx = np.ogrid[:HEIGHT, :WIDTH]
+    dist = np.sqrt((xx - cx_glow) ** 2 + (yy - cy_glow) ** 2)
+    glow_alpha = np.clip(25 * (1 - dist / 300), 0, 25).astype(np.uint8)
+    glow_white = np.full_like(glow_alpha, 255)
+    fx = Image.fromarray(np.dstack([glow_white, glow_white, glow_white, glow_alpha]), 'RGBA')
+
+    # Load app icon and place on the right side
+    if icon is None and os.path.exists(icon_path):
+        icon = Image.open(icon_path)
+    if icon is not None:
+        icon_size = 280
+        icon = icon.convert('RGBA').resize((icon_size, icon_size), Image.LANCZOS)
+
+        # Add soft shadow behind icon, drawn on a buffer just big enough for the blur
+        icon_x = WIDTH - icon_size - 100
+        icon_y = (HEIGHT - icon_size) // 2
+        shadow_offset = 6
+        shadow_blur = 12
+        shadow_pad = 3 * shadow_blur
+        shadow = Image.new('RGBA', (icon_size + 2 * shadow_pad,) * 2, (0, 0, 0, 0))
+        ImageDraw.Draw(shadow).rounded_rectangle(
+            [(shadow_pad, shadow_pad), (shadow_pad + icon_size, shadow_pad + icon_size)],
+            radius=55,
+            fill=(0, 0, 0, 40)
+        )
+        shadow = shadow.filter(ImageFilter.GaussianBlur(shadow_blur))
+        fx.alpha_composite(
+            shadow,
+            (icon_x - shadow_pad + shadow_offset, icon_y - shadow_pad + shadow_offset)
+        )
+
+    img.paste(fx, (0, 0), fx)
+    # RGBA ink on the RGB canvas blends the translucent text colours
+    draw = ImageDraw.Draw(img, 'RGBA')
+
+    if icon is not None:
+        img.paste(icon, (icon_x, icon_y), icon)
+
+    # Text on the left side
+    # Try to load a nice font, fall back to default
+    text_x = 80
+    white = (255, 255, 255)
+    white_sub = (255, 255, 255, 220)
+
+    title_path, subtitle_path, tagline_path = resolve_font_paths()
+    font_title = load_font(title_path, 62)
+    font_subtitle = load_font(subtitle_path, 30)
+    font_tagline = load_font(tagline_path, 24)
+
+    # App name
+    title_y = 130
+    draw.text((text_x, title_y), "Family", fill=white, font=font_title)
+    draw.text((text_x, title_y + 70), "Shopping List", fill=white, font=font_title)
+
+    # Divider line
+    line_y = title_y + 160
+    draw.line([(text_x, line_y), (text_x + 80, line_y)], fill=(255, 255, 255, 180), width=3)
+
+    # Tagline
+    draw.text(
+        (text_x, line_y + 20),
+        "Shop together. Stay organized.",
+        fill=white_sub,
+        font=font_subtitle
+    )
+
+    # Sub-tagline
+    draw.text(
+        (text_x, line_y + 60),
+        "Real-time sync  |  Budget tracking  |  Family groups",
+        fill=(255, 255, 255, 160),
+        font=font_tagline
+    )
+
+    img.save(output_path, 'PNG')
+    print(f"Feature graphic saved to: {output_path}")
+
+
+if __name__ == '__main__':
+    main()
@@ -1,11 +1,45 @@
-"""Generate Android mipmap icons from the 512x512 source icon."""
+"""Generate Android mipmap icons from the app icon."""
+from concurrent.futures import ThreadPoolExecutor
 from PIL import Image
 import os
+import shutil
+
+try:
+    import fpnge
+except ImportError:
+    fpnge = None
 
 src = os.path.join(os.path.dirname(__file__), '..', 'assets', 'app-icon-512.png')
 res_dir = os.path.join(os.path.dirname(__file__), '..', 'android', 'app', 'src', 'main', 'res')
 
-img = Image.open(src).convert('RGBA')
+
+def save_png(image, path):
+    """Write image as PNG, using the fpnge encoder when it is installed."""
+    if fpnge is not None:
+        with open(path, 'wb') as f:
+            f.write(fpnge.fromPIL(image))
+    else:
+        # Level 1 is several times faster than the default and barely larger
+        image.save(path, 'PNG', compress_level=1)
+
+
+def write_mipmap(folder, image):
+    """Encode image into folder as both ic_launcher.png and ic_launcher_round.png."""
+    out_dir = os.path.join(res_dir, folder)
+    os.makedirs(out_dir, exist_ok=True)
+
+    # Regular and round icons are byte-identical: encode once, then link
+    launcher = os.path.join(out_dir, 'ic_launcher.png')
+    launcher_round = os.path.join(out_dir, 'ic_launcher_round.png')
+    save_png(image, launcher)
+    if os.path.exists(launcher_round):
+        os.remove(launcher_round)
+    try:
+        os.link(launcher, launcher_round)
+    except OSError:
+        shutil.copyfile(launcher, launcher_round)
+    return folder, image.width
+
 
 # Android mipmap sizes
 sizes = {
@@ -16,15 +50,31 @@ sizes = {
     'mipmap-xxxhdpi': 192,
 }
 
-for folder, size in sizes.items():
-    out_dir = os.path.join(res_dir, folder)
-    os.makedirs(out_dir, exist_ok=True)
 
-    resized = img.resize((size, size), Image.LANCZOS)
+def main(icon=None):
+    """Write every mipmap size.
+
+    icon is the source image (any size at least 192px); when omitted it is
+    read from src.
+    """
+    if icon is None:
+        icon = Image.open(src)
+
+    # Go largest first and downscale each size from the previous one, so every
+    # step filters a small intermediate rather than the full-size source
+    mipmaps = []
+    resized = icon.convert('RGBA')
+    for folder, size in sorted(sizes.items(), key=lambda kv: -kv[1]):
+        resized = resized.resize((size, size), Image.LANCZOS)
+        mipmaps.append((folder, resized))
+
+    # PNG encoding dominates and releases the GIL, so write the sizes in parallel
+    with ThreadPoolExecutor(max_workers=len(mipmaps)) as pool:
+        for folder, size in pool.map(lambda m: write_mipmap(*m), mipmaps):
+            print(f"  {folder}: {size}x{size}")
+
+    print("\nAll mipmap icons generated!")
 
-    # Save as PNG for both regular and round
-    resized.save(os.path.join(out_dir, 'ic_launcher.png'), 'PNG')
-    resized.save(os.path.join(out_dir, 'ic_launcher_round.png'), 'PNG')
-    print(f"  {folder}: {size}x{size}")
 
-print("\nAll mipmap icons generated!")
+if __name__ == '__main__':
+    main()